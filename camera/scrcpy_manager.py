@@ -1,22 +1,86 @@
+import os
+import select
+import signal
 import subprocess
-from typing import Optional, List, Dict, Any
+import threading
+from typing import Optional, Any, Iterable, Mapping, Set, Tuple, Union
+
+from utils import system_utils
+
+__all__ = [
+    'start_scrcpy_feed',
+    'stop_scrcpy_feed',
+]
+
+
+def _drain_output(stream) -> None:
+    """Forwards lines from a scrcpy output pipe to stdout until it closes."""
+    with stream:
+        for line in stream:
+            print(f"[scrcpy] {line}", end='')
+
+
+def _build_scrcpy_command(
+    v4l2_device: str,
+    max_size: int,
+    video_playback: bool,
+    device_args: Union[Mapping[str, Any], Iterable[Tuple[str, Any]]],
+    extra_args: Mapping[str, Any]
+) -> Tuple[str, ...]:
+    """Builds the scrcpy command line for streaming to a v4l2 device.
+
+    Args:
+        v4l2_device: The v4l2-sink device.
+        max_size: Maximum feed resolution.
+        video_playback: If False, --no-playback is added.
+        device_args: Mapping or iterable of (option, value) pairs.
+        extra_args: Additional options, e.g. the **kwargs of start_scrcpy_feed.
+
+    Returns:
+        The command as a tuple of arguments.
+    """
+    if isinstance(device_args, Mapping):
+        device_args = device_args.items()
+    scrcpy_command = (
+        "scrcpy",
+        f"--max-size={max_size}",
+        f"--v4l2-sink={v4l2_device}",
+        *(f"--{arg_name}={arg_value}" for arg_name, arg_value in device_args),
+        *(f"--{arg_name}={arg_value}" for arg_name, arg_value in extra_args.items()),
+    )
+    if not video_playback:
+        scrcpy_command += ("--no-playback",)
+    return scrcpy_command
+
 
 def start_scrcpy_feed(
     feed_type: str = 'scrcpy',
     v4l2_device: str = '/dev/video0',
     max_size: int = 480,
     video_playback: bool = False,
+    verbose: bool = False,
+    device_args: Union[Mapping[str, Any], Iterable[Tuple[str, Any]]] = (),
+    cpu_affinity: Optional[Set[int]] = None,
     **kwargs: Any
 ) -> Optional[subprocess.Popen]:
     """Starts streaming selected feed_type to selected v4l2 device.
 
-    Currently only supports 'scrcpy'.
+    Currently only supports 'scrcpy'. The process is started in a new
+    session, so terminal signals such as Ctrl+C (SIGINT) and SIGHUP do not
+    reach it; the caller must always stop it with stop_scrcpy_feed().
 
     Args:
         feed_type: Select which feed to start. Defaults to 'scrcpy'.
         v4l2_device: Choose v4l2-sink device. Defaults to '/dev/video0'.
         max_size: Sets the feed resolution so it's <=max_size. Defaults to 480.
         video_playback: If True, show scrcpy video output; otherwise, don't.
+        verbose: If True, forward scrcpy's log output to stdout through a
+            background thread; otherwise it is discarded. Defaults to False.
+        device_args: Device configuration for scrcpy, either a mapping or an
+            iterable of (option, value) pairs such as a preset from
+            config.scrcpy_presets. Passed the same way as **kwargs.
+        cpu_affinity: CPUs to restrict scrcpy to, keeping its decoder off the
+            cores used by the hand tracker. None (default) leaves it unpinned.
         **kwargs: Additional device configuration for scrcpy. Examples:
             "video-codec" (str): e.g., "h264".
             "video-encoder" (str): e.g., "MX.qcom.video.encoder.avc".
@@ -35,18 +99,30 @@ def start_scrcpy_feed(
     if feed_type == 'scrcpy':
         print(f"Using v4l2loopback device: {v4l2_device}")
         try:
-            scrcpy_command: List[str] = [
-                "scrcpy",
-                f"--max-size={max_size}",
-                f"--v4l2-sink={v4l2_device}",
-            ]
-            for arg_name, arg_value in kwargs.items():
-                scrcpy_command.append(f"--{arg_name}={arg_value}")
-            if not video_playback:
-                scrcpy_command.append("--no-playback")
-            
+            scrcpy_command = _build_scrcpy_command(
+                v4l2_device, max_size, video_playback, device_args, kwargs
+            )
             print(f"Running command: {' '.join(scrcpy_command)}")
-            process = subprocess.Popen(scrcpy_command)
+            if verbose:
+                process = subprocess.Popen(
+                    scrcpy_command,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    start_new_session=True
+                )
+                threading.Thread(
+                    target=_drain_output, args=(process.stdout,), daemon=True
+                ).start()
+            else:
+                process = subprocess.Popen(
+                    scrcpy_command,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True
+                )
+            if cpu_affinity:
+                system_utils.set_cpu_affinity(process.pid, cpu_affinity)
         except FileNotFoundError:
             print("Error: scrcpy command not found. Is it installed and in your PATH?")
             raise
@@ -59,6 +135,65 @@ def start_scrcpy_feed(
     return process
 
 
+def _wait_pidfd(process: subprocess.Popen, timeout: float) -> int:
+    """Waits for a process to exit using a pidfd instead of sleep-polling.
+
+    subprocess.Popen.wait(timeout) polls the child with short sleeps. On Linux
+    (>= 5.3, Python >= 3.9) a pidfd becomes readable the moment the process
+    exits, so a single poll() call returns without any polling latency. Falls
+    back to Popen.wait(timeout) where pidfd_open is unavailable.
+
+    Args:
+        process: The Popen object to wait for.
+        timeout: Maximum time to wait, in seconds.
+
+    Returns:
+        The process return code.
+
+    Raises:
+        subprocess.TimeoutExpired: If the process is still running after timeout.
+    """
+    try:
+        pidfd = os.pidfd_open(process.pid)
+    except (AttributeError, OSError):
+        # No pidfd support, or the process has already been reaped.
+        return process.wait(timeout=timeout)
+
+    try:
+        poller = select.poll()
+        poller.register(pidfd, select.POLLIN)
+        if not poller.poll(int(timeout * 1000)):
+            raise subprocess.TimeoutExpired(process.args, timeout)
+    finally:
+        os.close(pidfd)
+    return process.wait()  # Already exited, only reaps the child
+
+
+def _signal_process_group(
+    process: subprocess.Popen,
+    sig: int
+) -> None:
+    """Sends a signal to the process group led by the scrcpy process.
+
+    scrcpy is started in its own session (and therefore process group), so a
+    single killpg also reaches any helper processes it spawned. If the process
+    shares our own process group (not started by start_scrcpy_feed), only the
+    process itself is signalled.
+
+    Args:
+        process: The Popen object for the scrcpy process.
+        sig: The signal to send, e.g. signal.SIGTERM.
+    """
+    try:
+        pgid = os.getpgid(process.pid)
+    except ProcessLookupError:
+        return  # Already gone
+    if pgid == os.getpgrp():
+        process.send_signal(sig)
+    else:
+        os.killpg(pgid, sig)
+
+
 def stop_scrcpy_feed(process: Optional[subprocess.Popen]):
     """Stops the scrcpy process.
 
@@ -71,14 +206,14 @@ def stop_scrcpy_feed(process: Optional[subprocess.Popen]):
 
     if process.poll() is None:  # Check if process is running
         print("Stopping scrcpy feed...")
-        process.terminate()  # Send SIGTERM
+        _signal_process_group(process, signal.SIGTERM)
         try:
-            process.wait(timeout=5)  # Wait for graceful termination
+            _wait_pidfd(process, timeout=5)  # Wait for graceful termination
             print("scrcpy feed stopped gracefully.")
         except subprocess.TimeoutExpired:
             print("scrcpy feed did not terminate gracefully, killing...")
-            process.kill()  # Send SIGKILL
+            _signal_process_group(process, signal.SIGKILL)
             process.wait() # Ensure it's killed
             print("scrcpy feed killed.")
     else:
-        print(f"scrcpy feed was already stopped (return code: {process.returncode}).")
\ No newline at end of file
+        print(f"scrcpy feed was already stopped (return code: {process.returncode}).")
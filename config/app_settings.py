@@ -6,9 +6,42 @@ V4L2_DEVICE = "/dev/video0"  # Virtual camera device for scrcpy output
 SCRCPY_MAX_SIZE = 240        # Max resolution (height or width) for scrcpy feed
 # SCRCPY_MAX_SIZE = 1080        # Max resolution (height or width) for scrcpy feed
 SCRCPY_CONFIG_PRESET_NAME = "Xperia Z2 Tablet - Open Camera" # Preset for scrcpy settings
+SCRCPY_VERBOSE = False       # Forward scrcpy's own log output to the terminal (for troubleshooting)
+CAMERA_STARTUP_TIMEOUT_S = 5.0  # How long to wait for scrcpy to start delivering frames
+
+# --- CPU Affinity (Linux only) ---
+# Keep scrcpy's decoder and the hand tracker on disjoint CPUs to reduce
+# contention (e.g. SCRCPY_CPU_AFFINITY = {0, 1}, TRACKER_CPU_AFFINITY = {2, 3}).
+# None leaves scheduling to the OS. If only TRACKER_CPU_AFFINITY is set, scrcpy
+# keeps the CPUs the application was started with.
+SCRCPY_CPU_AFFINITY = None
+TRACKER_CPU_AFFINITY = None
+
+# --- Display Configuration ---
+# Show OpenCV preview windows. If False, runs headless (no drawing or display);
+# type 'q' and press Enter in the terminal to quit.
+SHOW_PREVIEW = True
+SHOW_RAW_FEED = False        # With SHOW_PREVIEW, also show the unannotated camera feed in its own window (for debugging)
 
 # --- MediaPipe Model Configuration ---
-MODEL_ASSET_PATH = '{your_path_to}/hand_landmarker.task'
+# Hand landmark model variant: "full" (more accurate) or "lite" (faster, about
+# 17 ms vs 27 ms per frame on CPU). Each variant needs its own .task file.
+HAND_MODEL_VARIANT = "full"
+MODEL_ASSET_PATHS = {
+    "full": '{your_path_to}/hand_landmarker.task',
+    "lite": '{your_path_to}/hand_landmarker_lite.task',
+}
+MODEL_ASSET_PATH = MODEL_ASSET_PATHS[HAND_MODEL_VARIANT]
+# Inference backend for the hand tracker: "gpu" or "cpu". Falls back to the CPU
+# if the GPU delegate is not available on this platform.
+HAND_TRACKER_DELEGATE = "gpu"
+# Skip hand detection on frames that barely differ from the last detected one.
+# The difference is the mean absolute pixel difference (0-255) of 32x32
+# grayscale thumbnails. Set to 0 to run detection on every frame.
+MOTION_SKIP_THRESHOLD = 1.0
+# Run detection at least this often (milliseconds) even without motion, so
+# pending pinch state changes are still confirmed while the hand is still.
+MOTION_SKIP_MAX_INTERVAL_MS = 200
 
 # --- Mouse Control Configuration ---
 ENABLE_MOUSE_CONTROL = True
@@ -47,6 +80,14 @@ ADAPTIVE_SMOOTHING_VELOCITY_HIGH_THRESHOLD = 0.025 # Threshold for clear, intent
 # Between LOW and HIGH thresholds, the factor is linearly interpolated.
 # Ensure ADAPTIVE_SMOOTHING_VELOCITY_LOW_THRESHOLD < ADAPTIVE_SMOOTHING_VELOCITY_HIGH_THRESHOLD.
 
+# One Euro filter: alternative to the smoothing above. Takes precedence over
+# ENABLE_ADAPTIVE_SMOOTHING when enabled. Its cutoff frequency rises with cursor
+# speed, so the cursor is smooth at rest and responsive when moving fast.
+ENABLE_ONE_EURO_FILTER = False
+ONE_EURO_MIN_CUTOFF = 1.0   # Hz. Lower = less jitter at rest, more lag.
+ONE_EURO_BETA = 0.01        # Cutoff increase per pixel/second of cursor speed.
+ONE_EURO_D_CUTOFF = 1.0     # Hz. Cutoff for the speed estimate.
+
 # --- Pinch Click Configuration ---
 ENABLE_PINCH_CLICK = True
 # Landmark indices for pinch detection (MediaPipe HandLandmark enum)
@@ -55,4 +96,11 @@ INDEX_FINGER_TIP_INDEX = mp.solutions.hands.HandLandmark.INDEX_FINGER_TIP.value
 # Distance threshold for pinch detection (in normalized coordinates).
 # This value may need tuning based on camera setup and desired sensitivity.
 # A smaller value requires fingers to be closer.
-PINCH_CLICK_DISTANCE_THRESHOLD = 0.08
\ No newline at end of file
+PINCH_CLICK_DISTANCE_THRESHOLD = 0.08
+# Hysteresis: once pinched, fingers must move apart beyond
+# PINCH_CLICK_DISTANCE_THRESHOLD * PINCH_RELEASE_THRESHOLD_RATIO to release.
+# Prevents press/release chatter when the distance hovers near the threshold.
+PINCH_RELEASE_THRESHOLD_RATIO = 1.15
+# A pinch state change must persist for this long (milliseconds) before the
+# mouse button is pressed or released. Set to 0 to react immediately.
+PINCH_DEBOUNCE_MS = 100
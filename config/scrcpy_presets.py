@@ -1,34 +1,49 @@
-from typing import Dict
+from typing import Dict, Tuple
 
-_SCRCPY_PRESETS: Dict[str, Dict[str, str]] = {
-    'Xiaomi Mi 9t - Open Camera': {
-        "video-codec": "h264",
-        "video-encoder": "OMX.qcom.video.encoder.avc",
-        "crop": "1080:1080:0:600"
-    },
-    'Xperia Z2 Tablet - Open Camera': {
-        "video-codec": "h264",
-        "video-encoder": "OMX.qcom.video.encoder.avc",
-        "crop": "1080:1080:420:0",
-        "max-fps": "30"
-    }
+# A preset is an immutable sequence of (scrcpy option, value) pairs, passed
+# straight through as "--option=value" arguments.
+ScrcpyArgs = Tuple[Tuple[str, str], ...]
+
+# Low-latency encoder settings shared by the presets (scrcpy >= 2.0 options):
+# a modest constant bitrate keeps the encoder's rate-control window short, and
+# a 1 s keyframe interval lets the v4l2 stream recover quickly after drops.
+# bitrate-mode 2 is MediaCodecInfo.EncoderCapabilities.BITRATE_MODE_CBR.
+_LOW_LATENCY_ENCODER_ARGS: ScrcpyArgs = (
+    ("video-bit-rate", "2M"),
+    ("video-codec-options", "i-frame-interval:int=1,bitrate-mode:int=2"),
+)
+
+_SCRCPY_PRESETS: Dict[str, ScrcpyArgs] = {
+    'Xiaomi Mi 9t - Open Camera': (
+        ("video-codec", "h264"),
+        ("video-encoder", "OMX.qcom.video.encoder.avc"),
+        ("crop", "1080:1080:0:600"),
+        *_LOW_LATENCY_ENCODER_ARGS
+    ),
+    'Xperia Z2 Tablet - Open Camera': (
+        ("video-codec", "h264"),
+        ("video-encoder", "OMX.qcom.video.encoder.avc"),
+        ("crop", "1080:1080:420:0"),
+        ("max-fps", "30"),
+        *_LOW_LATENCY_ENCODER_ARGS
+    )
     # Add more presets here
 }
 
-def get_scrcpy_preset(cfg_name: str) -> Dict[str, str]:
+def get_scrcpy_preset(cfg_name: str) -> ScrcpyArgs:
     """Gets predefined scrcpy configurations for specific devices.
 
     Args:
         cfg_name: Name of the configuration preset.
 
     Returns:
-        A dictionary containing scrcpy arguments. A copy of the preset is
-        returned to prevent modification of the original preset.
+        A tuple of (option, value) pairs containing scrcpy arguments. Presets
+        are immutable, so the stored preset is returned directly.
 
     Raises:
         ValueError: If an unknown cfg_name is provided.
     """
     if cfg_name in _SCRCPY_PRESETS:
-        return _SCRCPY_PRESETS[cfg_name].copy()
+        return _SCRCPY_PRESETS[cfg_name]
     else:
-        raise ValueError(f"Unknown scrcpy preset name: {cfg_name}")
\ No newline at end of file
+        raise ValueError(f"Unknown scrcpy preset name: {cfg_name}")
@@ -1,10 +1,134 @@
 # interaction/mouse_control.py
-import math # For distance calculation
+from collections import namedtuple
+import time
+import numpy as np
 from pynput.mouse import Controller as MouseController, Button
-from typing import List, Any # For type hinting hand_landmarks
+from typing import Callable, Optional
 
 from utils import system_utils
 from config import app_settings
+from interaction.one_euro import OneEuroFilter
+from vision.hand_tracker import NUM_HAND_LANDMARKS
+
+__all__ = ['MouseManager', 'process_hand_for_mouse_control', 'reload_settings']
+
+# Minimum time between two prints of the same per-frame warning.
+_WARNING_INTERVAL_NS = 5_000_000_000
+_last_warning_ns: dict[str, int] = {}
+
+
+def _warn_rate_limited(key: str, message: str):
+    """Prints a warning from the per-frame path at most once per interval.
+
+    Args:
+        key: Identifies the kind of warning; repeats with the same key within
+            _WARNING_INTERVAL_NS are dropped, whatever their message.
+        message: The text to print.
+    """
+    now_ns = time.monotonic_ns()
+    if now_ns - _last_warning_ns.get(key, -_WARNING_INTERVAL_NS) < _WARNING_INTERVAL_NS:
+        return
+    _last_warning_ns[key] = now_ns
+    print(message)
+
+
+# Snapshot of the app_settings values used on the per-frame path. Reading
+# attributes of a local namedtuple avoids repeated module attribute lookups.
+_Settings = namedtuple('_Settings', [
+    'enable_mouse_control',
+    'mouse_control_landmark_index',
+    'margin_left',
+    'margin_right',
+    'margin_top',
+    'margin_bottom',
+    'default_smoothing_factor',
+    'enable_adaptive_smoothing',
+    'adaptive_min_factor',
+    'adaptive_factor_span',
+    'adaptive_velocity_scale',
+    'adaptive_velocity_bias',
+    'enable_one_euro_filter',
+    'one_euro_min_cutoff',
+    'one_euro_beta',
+    'one_euro_d_cutoff',
+    'enable_pinch_click',
+    'thumb_tip_index',
+    'index_finger_tip_index',
+    'pinch_click_distance_threshold_sq',
+    'pinch_release_distance_threshold_sq',
+    'pinch_debounce_ns',
+])
+
+
+def _load_settings() -> _Settings:
+    """Reads the mouse control values from app_settings into a _Settings tuple."""
+    # Adaptive smoothing maps velocity v to ratio = clamp(v * scale + bias, 0, 1),
+    # i.e. (v - low) / (high - low). An invalid range (high <= low) pins the
+    # ratio to 1 so the max factor is always used.
+    low_thresh = app_settings.ADAPTIVE_SMOOTHING_VELOCITY_LOW_THRESHOLD
+    high_thresh = app_settings.ADAPTIVE_SMOOTHING_VELOCITY_HIGH_THRESHOLD
+    if high_thresh > low_thresh:
+        velocity_scale = 1.0 / (high_thresh - low_thresh)
+        velocity_bias = -low_thresh * velocity_scale
+    else:
+        velocity_scale = 0.0
+        velocity_bias = 1.0
+
+    return _Settings(
+        enable_mouse_control=app_settings.ENABLE_MOUSE_CONTROL,
+        mouse_control_landmark_index=app_settings.MOUSE_CONTROL_LANDMARK_INDEX,
+        margin_left=app_settings.MARGIN_LEFT,
+        margin_right=app_settings.MARGIN_RIGHT,
+        margin_top=app_settings.MARGIN_TOP,
+        margin_bottom=app_settings.MARGIN_BOTTOM,
+        default_smoothing_factor=app_settings.DEFAULT_SMOOTHING_FACTOR,
+        enable_adaptive_smoothing=app_settings.ENABLE_ADAPTIVE_SMOOTHING,
+        adaptive_min_factor=app_settings.ADAPTIVE_SMOOTHING_MIN_FACTOR,
+        adaptive_factor_span=app_settings.ADAPTIVE_SMOOTHING_MAX_FACTOR - app_settings.ADAPTIVE_SMOOTHING_MIN_FACTOR,
+        adaptive_velocity_scale=velocity_scale,
+        adaptive_velocity_bias=velocity_bias,
+        enable_one_euro_filter=app_settings.ENABLE_ONE_EURO_FILTER,
+        one_euro_min_cutoff=app_settings.ONE_EURO_MIN_CUTOFF,
+        one_euro_beta=app_settings.ONE_EURO_BETA,
+        one_euro_d_cutoff=app_settings.ONE_EURO_D_CUTOFF,
+        enable_pinch_click=app_settings.ENABLE_PINCH_CLICK,
+        thumb_tip_index=app_settings.THUMB_TIP_INDEX,
+        index_finger_tip_index=app_settings.INDEX_FINGER_TIP_INDEX,
+        pinch_click_distance_threshold_sq=app_settings.PINCH_CLICK_DISTANCE_THRESHOLD ** 2,
+        pinch_release_distance_threshold_sq=(app_settings.PINCH_CLICK_DISTANCE_THRESHOLD
+                                             * app_settings.PINCH_RELEASE_THRESHOLD_RATIO) ** 2,
+        pinch_debounce_ns=int(app_settings.PINCH_DEBOUNCE_MS * 1_000_000),
+    )
+
+
+_CFG = _load_settings()
+
+
+def reload_settings():
+    """Re-reads app_settings after they have been changed at runtime.
+
+    MouseManager caches a screen transform derived from the margins; use
+    MouseManager.reload_settings() to refresh both at once.
+    """
+    global _CFG
+    _CFG = _load_settings()
+
+
+def _validate_landmark_indices(cfg: _Settings):
+    """Checks that the configured landmark indices exist in a detected hand.
+
+    Raises:
+        ValueError: If any configured landmark index is out of range.
+    """
+    for name, index in (
+        ('MOUSE_CONTROL_LANDMARK_INDEX', cfg.mouse_control_landmark_index),
+        ('THUMB_TIP_INDEX', cfg.thumb_tip_index),
+        ('INDEX_FINGER_TIP_INDEX', cfg.index_finger_tip_index),
+    ):
+        if not 0 <= index < NUM_HAND_LANDMARKS:
+            raise ValueError(f"{name} ({index}) is out of range for the "
+                             f"{NUM_HAND_LANDMARKS} hand landmarks. Adjust it in app_settings.py.")
+
 
 class MouseManager:
     """Encapsulates state related to mouse control."""
@@ -17,21 +141,57 @@ class MouseManager:
         self.is_first_move: bool = True
         self.is_left_button_pinched: bool = False
 
+        # For pinch debouncing: candidate pinch state and when it was first seen
+        self._pending_pinch_state: bool = False
+        self._pending_since_ns: int = 0
+
         # For adaptive smoothing
         self.prev_raw_landmark_x: float | None = None
         self.prev_raw_landmark_y: float | None = None
 
+        # For the One Euro filter (created in _select_handlers() when enabled)
+        self._euro_x: OneEuroFilter | None = None
+        self._euro_y: OneEuroFilter | None = None
+
+        # Affine landmark -> screen transform (screen = scale * landmark + offset)
+        # and screen bounds, computed from the margins and screen size in
+        # _update_transform() so the per-frame path has no division.
+        self._sx: float = 0.0
+        self._bx: float = 0.0
+        self._sy: float = 0.0
+        self._by: float = 0.0
+        self._xmax: int = 0
+        self._ymax: int = 0
+
+        # Last cursor position written to the mouse controller.
+        self._last_set: tuple[int, int] = (-1, -1)
+
+        # Per-frame handlers chosen from the enable flags in _select_handlers(),
+        # so the flags are not re-checked on every frame.
+        self._move_fn: Callable[[np.ndarray, 'MouseManager'], None] | None = None
+        self._click_fn: Callable[[np.ndarray, 'MouseManager'], None] | None = None
+
 
     def initialize(self) -> bool:
         """Initializes mouse controller and screen dimensions.
         
         Returns:
-            True if initialization (or disabling) was successful, False otherwise.
+            True if initialization (or disabling) was successful, False otherwise
+            (including when a configured landmark index is out of range).
         """
-        if not app_settings.ENABLE_MOUSE_CONTROL:
+        if not _CFG.enable_mouse_control:
             print("Mouse control is disabled by configuration.")
             return True # Successful in the sense that it's correctly disabled
 
+        # Indices are checked once here so the per-frame path can index directly.
+        try:
+            _validate_landmark_indices(_CFG)
+        except ValueError as e:
+            print(f"Error: {e}")
+            print("Mouse control will be disabled.")
+            self.mouse_controller = None
+            return False
+
         try:
             self.mouse_controller = MouseController()
             self.screen_width, self.screen_height = system_utils.get_screen_resolution()
@@ -40,15 +200,23 @@ class MouseManager:
                 print("Warning: Could not get screen resolution. Disabling mouse control.")
                 self.mouse_controller = None # Ensure it's None
                 return False # Indicate failure to enable mouse control fully
-            
+
+            if not self._update_transform():
+                print("Mouse control will be disabled.")
+                self.mouse_controller = None
+                return False
+
             print(f"Screen resolution: {self.screen_width}x{self.screen_height}. Mouse control enabled.")
             # Initialize last target to screen center for smoother start.
             self.last_target_x = self.screen_width / 2
             self.last_target_y = self.screen_height / 2
             self.is_first_move = True
             self.is_left_button_pinched = False
+            self._pending_pinch_state = False
             self.prev_raw_landmark_x = None # Initialize for adaptive smoothing
             self.prev_raw_landmark_y = None
+            self._last_set = (-1, -1)
+            self._select_handlers()
             return True
 
         except Exception as e:
@@ -57,6 +225,62 @@ class MouseManager:
             self.mouse_controller = None
             return False # Indicate failure
 
+    def _update_transform(self) -> bool:
+        """Folds the margins and screen size into the affine screen transform.
+
+        Returns:
+            True if the transform was computed, False if the margins leave no
+            active area.
+        """
+        cfg = _CFG
+        active_width_ratio = 1.0 - cfg.margin_left - cfg.margin_right
+        active_height_ratio = 1.0 - cfg.margin_top - cfg.margin_bottom
+        if active_width_ratio <= 0 or active_height_ratio <= 0:
+            print("Error: Margins are too large, active area is zero or negative. Adjust MARGIN values in app_settings.py.")
+            return False
+
+        self._sx = self.screen_width / active_width_ratio
+        self._bx = -cfg.margin_left * self._sx
+        self._sy = self.screen_height / active_height_ratio
+        self._by = -cfg.margin_top * self._sy
+        self._xmax = self.screen_width - 1
+        self._ymax = self.screen_height - 1
+        return True
+
+    def _select_handlers(self):
+        """Picks the movement and click handlers matching the current settings."""
+        cfg = _CFG
+        if cfg.enable_one_euro_filter:
+            self._euro_x = OneEuroFilter(cfg.one_euro_min_cutoff, cfg.one_euro_beta,
+                                         cfg.one_euro_d_cutoff)
+            self._euro_y = OneEuroFilter(cfg.one_euro_min_cutoff, cfg.one_euro_beta,
+                                         cfg.one_euro_d_cutoff)
+            self._move_fn = _handle_move_one_euro
+        elif cfg.enable_adaptive_smoothing:
+            self._move_fn = _handle_move_adaptive
+        else:
+            self._move_fn = _handle_move_fixed
+        self._click_fn = _handle_pinch_click if cfg.enable_pinch_click else None
+
+    def reload_settings(self) -> bool:
+        """Re-reads app_settings and recomputes the cached screen transform.
+
+        Returns:
+            True if the new settings were applied. False if a landmark index is
+            out of range (the previous settings are kept) or the margins are
+            invalid (the previous transform is kept).
+        """
+        try:
+            _validate_landmark_indices(_load_settings())
+        except ValueError as e:
+            print(f"Error: {e} Keeping the previous settings.")
+            return False
+        reload_settings()
+        self._select_handlers()
+        if self.screen_width and self.screen_height:
+            return self._update_transform()
+        return True
+
     def cleanup(self):
         """Releases any held mouse buttons during cleanup."""
         if self.mouse_controller and self.is_left_button_pinched:
@@ -68,118 +292,177 @@ class MouseManager:
                 print(f"Error releasing mouse button during cleanup: {e}")
 
 
-def _handle_mouse_movement(
-    hand_landmarks: List[Any], # List of NormalizedLandmark for one hand
-    mouse_manager: MouseManager
-):
-    """Handles mouse pointer movement based on a control landmark with adaptive smoothing."""
-    if not (0 <= app_settings.MOUSE_CONTROL_LANDMARK_INDEX < len(hand_landmarks)):
-        print(f"Warning: MOUSE_CONTROL_LANDMARK_INDEX ({app_settings.MOUSE_CONTROL_LANDMARK_INDEX}) "
-              f"is out of range for detected landmarks ({len(hand_landmarks)}).")
-        return
+def _adaptive_smoothing_factor(velocity_sq: float, cfg: _Settings) -> float:
+    """Maps a squared landmark velocity to a smoothing factor.
 
-    control_landmark = hand_landmarks[app_settings.MOUSE_CONTROL_LANDMARK_INDEX]
-    current_raw_landmark_x = control_landmark.x
-    current_raw_landmark_y = control_landmark.y
+    Branch-free clamp and lerp between the adaptive min and max factors; the
+    scale/bias/span coefficients are precomputed in _load_settings().
 
-    current_smoothing_factor = app_settings.DEFAULT_SMOOTHING_FACTOR
+    Args:
+        velocity_sq: Squared distance moved by the control landmark since the
+            previous frame, in normalized coordinates.
+        cfg: Settings snapshot holding the precomputed coefficients.
 
-    if app_settings.ENABLE_ADAPTIVE_SMOOTHING:
-        if mouse_manager.prev_raw_landmark_x is not None and \
-           mouse_manager.prev_raw_landmark_y is not None:
-            
-            delta_x = current_raw_landmark_x - mouse_manager.prev_raw_landmark_x
-            delta_y = current_raw_landmark_y - mouse_manager.prev_raw_landmark_y
-            # Velocity proxy: Euclidean distance in normalized landmark space
-            velocity_proxy = math.sqrt(delta_x**2 + delta_y**2)
-
-            low_thresh = app_settings.ADAPTIVE_SMOOTHING_VELOCITY_LOW_THRESHOLD
-            high_thresh = app_settings.ADAPTIVE_SMOOTHING_VELOCITY_HIGH_THRESHOLD
-            min_factor = app_settings.ADAPTIVE_SMOOTHING_MIN_FACTOR
-            max_factor = app_settings.ADAPTIVE_SMOOTHING_MAX_FACTOR
-
-            if high_thresh <= low_thresh: # Invalid configuration, fallback
-                # print("Warning: Adaptive smoothing high_thresh <= low_thresh. Using max_factor.")
-                current_smoothing_factor = max_factor
-            elif velocity_proxy <= low_thresh:
-                current_smoothing_factor = min_factor
-            elif velocity_proxy >= high_thresh:
-                current_smoothing_factor = max_factor
-            else:
-                # Linear interpolation between min_factor and max_factor
-                ratio = (velocity_proxy - low_thresh) / (high_thresh - low_thresh)
-                current_smoothing_factor = min_factor + ratio * (max_factor - min_factor)
-                # Clamp to ensure it's within [min_factor, max_factor] bounds
-                current_smoothing_factor = min(max(current_smoothing_factor, min_factor), max_factor)
-        # If prev_raw_landmark is None (e.g., first frame after detection or hand reappearance),
-        # current_smoothing_factor remains app_settings.DEFAULT_SMOOTHING_FACTOR for this frame.
-    
-    # Update previous raw landmark positions for the next frame's velocity calculation
-    mouse_manager.prev_raw_landmark_x = current_raw_landmark_x
-    mouse_manager.prev_raw_landmark_y = current_raw_landmark_y
+    Returns:
+        The smoothing factor in [min factor, max factor].
+    """
+    ratio = velocity_sq ** 0.5 * cfg.adaptive_velocity_scale + cfg.adaptive_velocity_bias
+    ratio = min(max(ratio, 0.0), 1.0)
+    return cfg.adaptive_min_factor + cfg.adaptive_factor_span * ratio
 
-    # Normalize landmark coordinates within the defined margins
-    active_width_ratio = 1.0 - app_settings.MARGIN_LEFT - app_settings.MARGIN_RIGHT
-    active_height_ratio = 1.0 - app_settings.MARGIN_TOP - app_settings.MARGIN_BOTTOM
 
-    if active_width_ratio <= 0 or active_height_ratio <= 0:
-        print("Error: Margins are too large, active area is zero or negative. Adjust MARGIN values in app_settings.py.")
-        return
+def _map_to_screen(
+    landmark_x: float,
+    landmark_y: float,
+    mouse_manager: MouseManager
+) -> tuple[float, float]:
+    """Maps a normalized landmark position to an in-bounds screen position.
 
-    norm_x = min(max((control_landmark.x - app_settings.MARGIN_LEFT) / active_width_ratio, 0.0), 1.0)
-    norm_y = min(max((control_landmark.y - app_settings.MARGIN_TOP) / active_height_ratio, 0.0), 1.0)
-    
-    raw_screen_x = norm_x * mouse_manager.screen_width
-    raw_screen_y = norm_y * mouse_manager.screen_height
+    The area inside the margins is mapped onto the screen with the affine
+    transform precomputed in MouseManager._update_transform(), then clamped.
+    """
+    # Builtins bound once to locals (LOAD_FAST instead of LOAD_GLOBAL).
+    _min = min
+    _max = max
+    return (_min(_max(mouse_manager._sx * landmark_x + mouse_manager._bx, 0.0), mouse_manager._xmax),
+            _min(_max(mouse_manager._sy * landmark_y + mouse_manager._by, 0.0), mouse_manager._ymax))
+
+
+def _move_cursor(
+    landmark_x: float,
+    landmark_y: float,
+    smoothing_factor: float,
+    mouse_manager: MouseManager
+):
+    """Maps a landmark position to the screen, smooths it and moves the cursor."""
+    raw_screen_x, raw_screen_y = _map_to_screen(landmark_x, landmark_y, mouse_manager)
 
     if mouse_manager.is_first_move or mouse_manager.last_target_x is None:
         target_x = raw_screen_x
         target_y = raw_screen_y
         mouse_manager.is_first_move = False
     else:
-        target_x = (current_smoothing_factor * raw_screen_x +
-                    (1 - current_smoothing_factor) * mouse_manager.last_target_x)
-        target_y = (current_smoothing_factor * raw_screen_y +
-                    (1 - current_smoothing_factor) * mouse_manager.last_target_y)
+        target_x = (smoothing_factor * raw_screen_x +
+                    (1 - smoothing_factor) * mouse_manager.last_target_x)
+        target_y = (smoothing_factor * raw_screen_y +
+                    (1 - smoothing_factor) * mouse_manager.last_target_y)
     
     mouse_manager.last_target_x = target_x
     mouse_manager.last_target_y = target_y
 
-    final_x = max(0, min(int(target_x), mouse_manager.screen_width - 1))
-    final_y = max(0, min(int(target_y), mouse_manager.screen_height - 1))
-    
+    # The raw position is clamped above and the smoothed target is a blend of
+    # in-bounds positions, so it needs no second clamp.
+    _set_cursor_position(int(target_x), int(target_y), mouse_manager)
+
+
+def _set_cursor_position(final_x: int, final_y: int, mouse_manager: MouseManager):
+    """Moves the cursor to an in-bounds screen position."""
+    # Setting the position is a round trip to the display server; skip it when
+    # the integer cursor position has not changed since the last write.
+    final_position = (final_x, final_y)
+    if final_position == mouse_manager._last_set:
+        return
+
     try:
-        mouse_manager.mouse_controller.position = (final_x, final_y)
+        mouse_manager.mouse_controller.position = final_position
+        mouse_manager._last_set = final_position
     except Exception as e:
-        print(f"Error setting mouse position: {e}")
+        _warn_rate_limited("set_position", f"Error setting mouse position: {e}")
+
+
+def _handle_move_fixed(
+    hand_landmarks: np.ndarray, # (N, 3) float32 array of x, y, z for one hand
+    mouse_manager: MouseManager
+):
+    """Handles mouse pointer movement with the fixed default smoothing factor."""
+    # tolist() converts the row to Python floats in one call, so the scalar
+    # math does not operate on NumPy scalars.
+    control_landmark = hand_landmarks[_CFG.mouse_control_landmark_index].tolist()
+    _move_cursor(control_landmark[0], control_landmark[1],
+                 _CFG.default_smoothing_factor, mouse_manager)
+
+
+def _handle_move_adaptive(
+    hand_landmarks: np.ndarray, # (N, 3) float32 array of x, y, z for one hand
+    mouse_manager: MouseManager
+):
+    """Handles mouse pointer movement based on a control landmark with adaptive smoothing."""
+    cfg = _CFG
+    control_landmark = hand_landmarks[cfg.mouse_control_landmark_index].tolist()
+    current_raw_landmark_x = control_landmark[0]
+    current_raw_landmark_y = control_landmark[1]
+
+    if mouse_manager.prev_raw_landmark_x is not None and \
+       mouse_manager.prev_raw_landmark_y is not None:
+        delta_x = current_raw_landmark_x - mouse_manager.prev_raw_landmark_x
+        delta_y = current_raw_landmark_y - mouse_manager.prev_raw_landmark_y
+        # Velocity proxy: squared Euclidean distance in normalized landmark space
+        velocity_sq = delta_x * delta_x + delta_y * delta_y
+        current_smoothing_factor = _adaptive_smoothing_factor(velocity_sq, cfg)
+    else:
+        # First frame after detection or hand reappearance: no velocity yet.
+        current_smoothing_factor = cfg.default_smoothing_factor
+    
+    # Update previous raw landmark positions for the next frame's velocity calculation
+    mouse_manager.prev_raw_landmark_x = current_raw_landmark_x
+    mouse_manager.prev_raw_landmark_y = current_raw_landmark_y
+
+    _move_cursor(current_raw_landmark_x, current_raw_landmark_y,
+                 current_smoothing_factor, mouse_manager)
+
+
+def _handle_move_one_euro(
+    hand_landmarks: np.ndarray, # (N, 3) float32 array of x, y, z for one hand
+    mouse_manager: MouseManager
+):
+    """Handles mouse pointer movement smoothed by per-axis One Euro filters."""
+    control_landmark = hand_landmarks[_CFG.mouse_control_landmark_index].tolist()
+    raw_screen_x, raw_screen_y = _map_to_screen(control_landmark[0], control_landmark[1],
+                                                mouse_manager)
+
+    # The filters blend in-bounds positions, so the output stays in bounds.
+    now_ns = time.monotonic_ns()
+    _set_cursor_position(int(mouse_manager._euro_x(raw_screen_x, now_ns)),
+                         int(mouse_manager._euro_y(raw_screen_y, now_ns)),
+                         mouse_manager)
 
 
 def _handle_pinch_click(
-    hand_landmarks: List[Any], # List of NormalizedLandmark for one hand
+    hand_landmarks: np.ndarray, # (N, 3) float32 array of x, y, z for one hand
     mouse_manager: MouseManager
 ):
     """Handles pinch gesture for left mouse button click."""
-    if not app_settings.ENABLE_PINCH_CLICK:
-        return
+    cfg = _CFG
+    thumb_tip = hand_landmarks[cfg.thumb_tip_index].tolist()
+    index_finger_tip = hand_landmarks[cfg.index_finger_tip_index].tolist()
 
-    # Ensure landmark indices are valid
-    required_indices = [app_settings.THUMB_TIP_INDEX, app_settings.INDEX_FINGER_TIP_INDEX]
-    if not all(0 <= idx < len(hand_landmarks) for idx in required_indices):
-        print(f"Warning: Pinch click landmark indices are out of range for detected landmarks ({len(hand_landmarks)}).")
-        return
+    # Squared 2D distance between thumb tip and index finger tip using normalized
+    # coordinates, compared against the squared threshold (no sqrt needed).
+    delta_x = thumb_tip[0] - index_finger_tip[0]
+    delta_y = thumb_tip[1] - index_finger_tip[1]
+    # Consider adding z-coordinate if needed:
+    # delta_z = thumb_tip[2] - index_finger_tip[2]
+    # distance_sq = delta_x * delta_x + delta_y * delta_y + delta_z * delta_z
+    distance_sq = delta_x * delta_x + delta_y * delta_y
 
-    thumb_tip = hand_landmarks[app_settings.THUMB_TIP_INDEX]
-    index_finger_tip = hand_landmarks[app_settings.INDEX_FINGER_TIP_INDEX]
+    # Schmitt trigger: a wider threshold applies while pinched, so noise
+    # around a single threshold does not toggle the state.
+    if mouse_manager.is_left_button_pinched:
+        is_pinching_currently = distance_sq < cfg.pinch_release_distance_threshold_sq
+    else:
+        is_pinching_currently = distance_sq < cfg.pinch_click_distance_threshold_sq
 
-    # Calculate 2D distance between thumb tip and index finger tip using normalized coordinates
-    delta_x = thumb_tip.x - index_finger_tip.x
-    delta_y = thumb_tip.y - index_finger_tip.y
-    # Consider adding z-coordinate if needed:
-    # delta_z = thumb_tip.z - index_finger_tip.z
-    # distance = math.sqrt(delta_x**2 + delta_y**2 + delta_z**2)
-    distance = math.sqrt(delta_x**2 + delta_y**2)
+    if is_pinching_currently == mouse_manager.is_left_button_pinched:
+        mouse_manager._pending_pinch_state = is_pinching_currently
+        return
 
-    is_pinching_currently = distance < app_settings.PINCH_CLICK_DISTANCE_THRESHOLD
+    # Only act once the new state has persisted for the debounce interval.
+    now_ns = time.monotonic_ns()
+    if is_pinching_currently != mouse_manager._pending_pinch_state:
+        mouse_manager._pending_pinch_state = is_pinching_currently
+        mouse_manager._pending_since_ns = now_ns
+    if now_ns - mouse_manager._pending_since_ns < cfg.pinch_debounce_ns:
+        return
 
     if is_pinching_currently and not mouse_manager.is_left_button_pinched:
         try:
@@ -187,47 +470,58 @@ def _handle_pinch_click(
             mouse_manager.is_left_button_pinched = True
             # print("Pinch detected - Left mouse button PRESSED.") # Optional: for debugging
         except Exception as e:
-            print(f"Error pressing left mouse button due to pinch: {e}")
+            _warn_rate_limited("press", f"Error pressing left mouse button due to pinch: {e}")
     elif not is_pinching_currently and mouse_manager.is_left_button_pinched:
         try:
             mouse_manager.mouse_controller.release(Button.left)
             mouse_manager.is_left_button_pinched = False
             # print("Pinch released - Left mouse button RELEASED.") # Optional: for debugging
         except Exception as e:
-            print(f"Error releasing left mouse button after pinch: {e}")
+            _warn_rate_limited("release", f"Error releasing left mouse button after pinch: {e}")
 
 
 def process_hand_for_mouse_control(
-    hand_landmarks_list: List[Any], # List of mediapipe.framework.formats.landmark_pb2.NormalizedLandmark
+    hand_landmarks: Optional[np.ndarray],
     mouse_manager: MouseManager
 ):
     """Processes hand landmarks to control the mouse pointer and handle clicks.
 
     Args:
-        hand_landmarks_list: A list of hand landmarks objects from MediaPipe.
-                             Expected to be result.hand_landmarks. Each element is a list
-                             of landmarks for one detected hand.
+        hand_landmarks: Landmarks of the first detected hand as an (N, 3)
+                        float32 array of normalized x, y, z coordinates (see
+                        hand_tracker.landmarks_to_array), or None if no hand
+                        was detected.
         mouse_manager: An instance of MouseManager containing mouse state and controller.
     """
-    if not (app_settings.ENABLE_MOUSE_CONTROL and mouse_manager.mouse_controller and
+    if not (_CFG.enable_mouse_control and mouse_manager.mouse_controller and
             mouse_manager.screen_width and mouse_manager.screen_height):
         return # Mouse control not active or not initialized
 
-    if hand_landmarks_list:
-        # Assuming num_hands=1 in landmarker options (set in hand_tracker.py),
-        # so take the first hand detected.
-        # hand_landmarks is a list of NormalizedLandmark objects for the first detected hand.
-        hand_landmarks_for_first_hand = hand_landmarks_list[0] 
-        
-        # Handle mouse movement
-        _handle_mouse_movement(hand_landmarks_for_first_hand, mouse_manager)
-        
-        # Handle pinch click
-        _handle_pinch_click(hand_landmarks_for_first_hand, mouse_manager)
+    if hand_landmarks is not None:
+        # Landmark indices are validated in initialize(); an IndexError here
+        # means the tracker returned fewer landmarks than expected.
+        try:
+            # Handle mouse movement (handler selected once in initialize())
+            mouse_manager._move_fn(hand_landmarks, mouse_manager)
+
+            # Handle pinch click, unless disabled by configuration
+            if mouse_manager._click_fn is not None:
+                mouse_manager._click_fn(hand_landmarks, mouse_manager)
+        except IndexError:
+            _warn_rate_limited("landmark_count",
+                               f"Warning: Expected {NUM_HAND_LANDMARKS} hand landmarks, got {len(hand_landmarks)}.")
     else:
         # No hands detected, reset previous landmark state for adaptive smoothing
         mouse_manager.prev_raw_landmark_x = None
         mouse_manager.prev_raw_landmark_y = None
+        # The cursor may be moved by other means while the hand is away, so
+        # the next position is written even if it matches the last one.
+        mouse_manager._last_set = (-1, -1)
+        # Restart the One Euro filters, so the gap does not register as a
+        # single large, slow movement when the hand reappears.
+        if mouse_manager._euro_x is not None:
+            mouse_manager._euro_x.reset()
+            mouse_manager._euro_y.reset()
         # Optionally, could also set mouse_manager.is_first_move = True
         # if we want the cursor to snap on re-detection without smoothing for the first frame.
         # Current behavior: if hand lost and reappears, first smoothed move will use DEFAULT_SMOOTHING_FACTOR.
\ No newline at end of file
@@ -0,0 +1,77 @@
+# interaction/one_euro.py
+import math
+
+__all__ = ['OneEuroFilter']
+
+_TWO_PI = 2.0 * math.pi
+
+
+def _smoothing_alpha(cutoff: float, dt: float) -> float:
+    """Returns the exponential smoothing factor for a cutoff frequency.
+
+    Args:
+        cutoff: Cutoff frequency in Hz.
+        dt: Time since the previous sample in seconds.
+    """
+    r = _TWO_PI * cutoff * dt
+    return r / (r + 1.0)
+
+
+class OneEuroFilter:
+    """One Euro filter for a noisy 1D signal (Casiez et al., CHI 2012).
+
+    An exponential low-pass filter whose cutoff frequency rises with the
+    signal's speed: slow movement is smoothed heavily (less jitter), fast
+    movement lightly (less lag).
+    """
+    def __init__(self, min_cutoff: float = 1.0, beta: float = 0.0, d_cutoff: float = 1.0):
+        """
+        Args:
+            min_cutoff: Cutoff frequency (Hz) at zero speed. Lower values
+                smooth more while the signal is still.
+            beta: How much the cutoff grows with speed. Higher values reduce
+                lag during fast movement.
+            d_cutoff: Cutoff frequency (Hz) for smoothing the speed estimate.
+        """
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.x_prev: float | None = None
+        self.dx_prev: float = 0.0
+        self.t_prev_ns: int | None = None
+
+    def reset(self):
+        """Forgets the filter state; the next sample passes through unchanged."""
+        self.x_prev = None
+        self.dx_prev = 0.0
+        self.t_prev_ns = None
+
+    def __call__(self, x: float, t_ns: int) -> float:
+        """Filters one sample.
+
+        Args:
+            x: The new raw value.
+            t_ns: Timestamp of the sample in nanoseconds (monotonic).
+
+        Returns:
+            The filtered value.
+        """
+        if self.x_prev is None:
+            self.x_prev = x
+            self.t_prev_ns = t_ns
+            return x
+
+        dt = (t_ns - self.t_prev_ns) * 1e-9
+        if dt <= 0.0:
+            return self.x_prev
+
+        alpha_d = _smoothing_alpha(self.d_cutoff, dt)
+        dx = alpha_d * (x - self.x_prev) / dt + (1.0 - alpha_d) * self.dx_prev
+
+        alpha = _smoothing_alpha(self.min_cutoff + self.beta * abs(dx), dt)
+        x_filtered = alpha * x + (1.0 - alpha) * self.x_prev
+
+        self.x_prev = x_filtered
+        self.dx_prev = dx
+        self.t_prev_ns = t_ns
+        return x_filtered
@@ -1,9 +1,13 @@
 # Standard library imports
-import queue
+import collections
+from concurrent.futures import Future, ThreadPoolExecutor
+import functools
+import sys
+import threading
 import time
 import traceback # For more detailed error logging if needed
 import subprocess
-import os # For checking model path
+import os
 
 # Third-party imports
 import cv2
@@ -14,55 +18,148 @@ from camera import scrcpy_manager
 from config import scrcpy_presets
 from config import app_settings # Import new application settings
 from interaction import mouse_control # Import new mouse control module
+from utils import system_utils
 from vision import drawing
 from vision import hand_tracker # Imports HandLandmarkerResult, MpImage, MpImageFormat
 
+# Thumbnail size (width, height) used to detect motion between frames.
+_MOTION_THUMBNAIL_SIZE = (32, 32)
+
+# Raw V4L2 pixel formats that can be converted straight to RGB, mapped to the
+# cv2 conversions (to RGB, to BGR). Both are YUV 4:2:0 layouts captured as a
+# single-channel image of height * 3 / 2 rows, with the Y plane on top.
+_RAW_YUV_CONVERSIONS = {
+    'YU12': (cv2.COLOR_YUV2RGB_I420, cv2.COLOR_YUV2BGR_I420),
+    'NV12': (cv2.COLOR_YUV2RGB_NV12, cv2.COLOR_YUV2BGR_NV12),
+}
+
+# How captured frames are turned into RGB for MediaPipe (see _select_frame_format).
+# raw_shape is None when OpenCV delivers BGR frames; luma_rows is the height of
+# the Y plane of raw frames.
+_FrameFormat = collections.namedtuple('_FrameFormat', ['raw_shape', 'luma_rows', 'to_rgb', 'to_bgr'])
+
 # --- Global State ---
-# Queue for passing annotated frames from MediaPipe callback to main thread.
-_annotated_frame_buffer = queue.Queue(maxsize=2)
+# Single-slot buffer holding the latest annotated frame for the main thread.
+# deque append/popleft are atomic, and maxlen=1 drops an undisplayed frame
+# when a newer one is appended.
+_annotated_frame_buffer: collections.deque = collections.deque(maxlen=1)
 
-# Initialize Mouse Manager
-_mouse_manager_instance = mouse_control.MouseManager()
+# Single worker that annotates frames for display, keeping the drawing off
+# MediaPipe's callback thread. Only the callback thread touches the future.
+_draw_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='draw')
+_draw_future: Future | None = None
+
+# Set from the stdin reader thread to quit when the preview windows are disabled.
+_quit_event = threading.Event()
 
 
 def _mediapipe_result_callback(
     result: hand_tracker.HandLandmarkerResult,
     output_image: hand_tracker.MpImage,
-    timestamp_ms: int  # pylint: disable=unused-argument
+    timestamp_ms: int,  # pylint: disable=unused-argument
+    *,
+    mouse_manager: mouse_control.MouseManager
 ):
     """Callback for MediaPipe HandLandmarker results.
 
-    Processes detection results, annotates images, and handles mouse control.
-    This function is called by MediaPipe in a separate thread.
+    Handles mouse control right away, as it is cheap and latency-sensitive,
+    and hands annotation for display to the drawing worker. If the worker is
+    still busy with a previous frame, this frame is not drawn.
+    This function is called by MediaPipe in a separate thread, with
+    mouse_manager bound via functools.partial in run_application().
 
     Args:
         result: The hand landmarker detection result.
         output_image: The MediaPipe image object (RGB) containing the frame data.
         timestamp_ms: The timestamp of the frame when detection was run.
+        mouse_manager: The initialized MouseManager driving the cursor.
     """
-    # output_image.numpy_view() provides an RGB NumPy array
-    annotated_rgb_image = drawing.draw_landmarks_on_image(
-        output_image.numpy_view(), result
-    )
-    # Convert to BGR for OpenCV display
-    annotated_bgr_image = cv2.cvtColor(annotated_rgb_image, cv2.COLOR_RGB2BGR)
-
-    try:
-        _annotated_frame_buffer.put_nowait(annotated_bgr_image)
-    except queue.Full:
-        # This is expected if the main loop is slower than the callback.
-        pass
+    global _draw_future
 
     # --- Mouse Control Logic (delegated) ---
+    # num_hands=1 in hand_tracker, so only the first hand is used.
+    first_hand_landmarks = (
+        hand_tracker.landmarks_to_array(result.hand_landmarks[0])
+        if result.hand_landmarks else None
+    )
     mouse_control.process_hand_for_mouse_control(
-        result.hand_landmarks, # This is a list of lists of landmarks
-        _mouse_manager_instance
+        first_hand_landmarks, mouse_manager
     )
 
+    if not app_settings.SHOW_PREVIEW:
+        return
+    if _draw_future is not None and not _draw_future.done():
+        return # Drop this frame's annotation; the worker is busy
+    _draw_future = _draw_executor.submit(_annotate_result, result, output_image)
+
+
+def _annotate_result(
+    result: hand_tracker.HandLandmarkerResult,
+    output_image: hand_tracker.MpImage
+):
+    """Annotates the frame and passes it to the main loop for display.
+
+    Runs on the drawing worker thread.
+
+    Args:
+        result: The hand landmarker detection result.
+        output_image: The MediaPipe image object (RGB) containing the frame data.
+    """
+    try:
+        # output_image.numpy_view() provides an RGB NumPy array. Convert it to BGR
+        # for OpenCV display first and annotate the BGR frame directly.
+        # The conversion yields a new array, so it is annotated in place.
+        annotated_bgr_image = cv2.cvtColor(output_image.numpy_view(), cv2.COLOR_RGB2BGR)
+        drawing.draw_landmarks_on_image_inplace(annotated_bgr_image, result)
+
+        # Replaces any frame the main loop has not displayed yet, so it always
+        # shows the latest annotation.
+        _annotated_frame_buffer.append(annotated_bgr_image)
+    except Exception:  # pylint: disable=broad-except
+        # Exceptions would otherwise be stored silently in the Future.
+        traceback.print_exc()
+
+
+def _wait_for_camera(scrcpy_process: subprocess.Popen) -> cv2.VideoCapture | None:
+    """Opens the V4L2 device once scrcpy delivers frames to it.
+
+    Polls until a frame can be read, so startup takes as long as scrcpy
+    actually needs rather than a fixed delay.
+
+    Args:
+        scrcpy_process: The running scrcpy process feeding the device.
+
+    Returns:
+        The opened VideoCapture, or None if no frame arrived within
+        CAMERA_STARTUP_TIMEOUT_S or scrcpy exited.
+    """
+    print(f"Waiting for scrcpy and v4l2 device to initialize "
+          f"(up to {app_settings.CAMERA_STARTUP_TIMEOUT_S} seconds)...")
+    deadline = time.monotonic() + app_settings.CAMERA_STARTUP_TIMEOUT_S
+    while time.monotonic() < deadline and scrcpy_process.poll() is None:
+        cam = cv2.VideoCapture(app_settings.V4L2_DEVICE)
+        if cam.isOpened():
+            ok, frame = cam.read()
+            if ok and frame is not None and frame.size > 0:
+                return cam
+        cam.release()
+        time.sleep(0.1)
+    return None
 
-def _initialize_camera_feed() -> tuple[cv2.VideoCapture | None, subprocess.Popen | None]:
+
+def _initialize_camera_feed(
+    scrcpy_cpu_affinity: set[int] | None = None
+) -> tuple[cv2.VideoCapture | None, subprocess.Popen | None]:
     """Starts scrcpy and connects to the V4L2 device.
 
+    scrcpy is started in its own session (see start_scrcpy_feed), so terminal
+    signals do not stop it. If setup fails or is interrupted after scrcpy
+    started, it is stopped here before returning or re-raising.
+
+    Args:
+        scrcpy_cpu_affinity: CPUs to restrict scrcpy to, or None to leave
+            it with the mask it inherits from this process.
+
     Returns:
         A tuple (cam, scrcpy_process). Both are None if initialization fails.
     """
@@ -73,38 +170,97 @@ def _initialize_camera_feed() -> tuple[cv2.VideoCapture | None, subprocess.Popen
     except ValueError as e:
         print(f"Warning: Error getting scrcpy preset '{app_settings.SCRCPY_CONFIG_PRESET_NAME}': {e}.")
         print("Using default scrcpy settings (no custom args).")
-        scrcpy_custom_args = {} # Ensure it's a dict
+        scrcpy_custom_args = () # No (option, value) pairs
     
     scrcpy_process = scrcpy_manager.start_scrcpy_feed(
         v4l2_device=app_settings.V4L2_DEVICE,
         max_size=app_settings.SCRCPY_MAX_SIZE,
         video_playback=False,  # No separate scrcpy window shown by scrcpy itself
-        **scrcpy_custom_args
+        verbose=app_settings.SCRCPY_VERBOSE,
+        device_args=scrcpy_custom_args,
+        cpu_affinity=scrcpy_cpu_affinity
     )
     if scrcpy_process is None:
         print("Failed to start scrcpy. Exiting.")
         return None, None
     
-    print("Waiting for scrcpy and v4l2 device to initialize (3 seconds)...")
-    time.sleep(3)
+    # scrcpy runs in its own session, so Ctrl+C in the terminal does not reach
+    # it. Stop it here if anything (including KeyboardInterrupt) interrupts the
+    # setup before the process is handed back to the caller for cleanup.
+    cam = None
+    try:
+        cam = _wait_for_camera(scrcpy_process)
+        if cam is None:
+            print(f"Error: Cannot open V4L2 device: {app_settings.V4L2_DEVICE}")
+            print("Make sure scrcpy is running and the v4l2loopback device is correctly set up.")
+            scrcpy_manager.stop_scrcpy_feed(scrcpy_process)
+            return None, None
+        # Keep a single driver buffer so read() returns the newest frame rather
+        # than one queued up to several frame periods ago.
+        cam.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
-    cam = cv2.VideoCapture(app_settings.V4L2_DEVICE)
-    if not cam.isOpened():
-        print(f"Error: Cannot open V4L2 device: {app_settings.V4L2_DEVICE}")
-        print("Make sure scrcpy is running and the v4l2loopback device is correctly set up.")
+        width = int(cam.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cam.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        print(f"Camera {app_settings.V4L2_DEVICE} opened with resolution: {width}x{height}")
+        if width == 0 or height == 0:
+            print("Error: Camera resolution is 0x0. Check scrcpy and v4l2loopback device.")
+            cam.release()
+            scrcpy_manager.stop_scrcpy_feed(scrcpy_process)
+            return None, None
+        # The loopback device delivers whatever scrcpy writes, so the frame size is
+        # controlled by --max-size; every per-frame step scales with pixel count.
+        if max(width, height) > app_settings.SCRCPY_MAX_SIZE:
+            print(f"Warning: Camera resolution {width}x{height} exceeds SCRCPY_MAX_SIZE "
+                  f"({app_settings.SCRCPY_MAX_SIZE}). Another producer may be writing to "
+                  f"{app_settings.V4L2_DEVICE}.")
+    except BaseException:
+        if cam is not None:
+            cam.release()
         scrcpy_manager.stop_scrcpy_feed(scrcpy_process)
-        return None, None
-    
+        raise
+
+    return cam, scrcpy_process
+
+
+def _watch_stdin_for_quit():
+    """Sets _quit_event once 'q' is entered on stdin (headless mode)."""
+    for line in sys.stdin:
+        if line.strip().lower() == 'q':
+            _quit_event.set()
+            return
+
+
+def _select_frame_format(cam: cv2.VideoCapture) -> _FrameFormat:
+    """Picks how captured frames are converted to RGB for MediaPipe.
+
+    scrcpy's v4l2 sink writes YUV 4:2:0. Reading it raw (CAP_PROP_CONVERT_RGB
+    off) needs a single YUV to RGB conversion per frame, instead of OpenCV's
+    YUV to BGR conversion followed by BGR to RGB. Falls back to BGR frames if
+    the device's pixel format is not one of _RAW_YUV_CONVERSIONS or raw
+    capture does not work.
+
+    Args:
+        cam: Initialized OpenCV VideoCapture object. One frame is read from it
+             to verify raw capture.
+
+    Returns:
+        The _FrameFormat to use in main_loop.
+    """
     width = int(cam.get(cv2.CAP_PROP_FRAME_WIDTH))
     height = int(cam.get(cv2.CAP_PROP_FRAME_HEIGHT))
-    print(f"Camera {app_settings.V4L2_DEVICE} opened with resolution: {width}x{height}")
-    if width == 0 or height == 0:
-        print("Error: Camera resolution is 0x0. Check scrcpy and v4l2loopback device.")
-        cam.release()
-        scrcpy_manager.stop_scrcpy_feed(scrcpy_process)
-        return None, None
-        
-    return cam, scrcpy_process
+    fourcc = int(cam.get(cv2.CAP_PROP_FOURCC)).to_bytes(4, 'little').decode('ascii', errors='replace').strip('\x00')
+
+    conversions = _RAW_YUV_CONVERSIONS.get(fourcc)
+    if conversions is not None and cam.set(cv2.CAP_PROP_CONVERT_RGB, 0):
+        raw_shape = (height * 3 // 2, width)
+        cam_status, frame = cam.read()
+        if cam_status and frame.size == raw_shape[0] * raw_shape[1]:
+            print(f"Capturing raw {fourcc} frames, converted directly to RGB.")
+            return _FrameFormat(raw_shape, height, *conversions)
+        cam.set(cv2.CAP_PROP_CONVERT_RGB, 1)
+
+    print(f"Capturing BGR frames (device pixel format: {fourcc}).")
+    return _FrameFormat(None, height, cv2.COLOR_BGR2RGB, None)
 
 
 def main_loop(
@@ -117,49 +273,115 @@ def main_loop(
         cam: Initialized OpenCV VideoCapture object.
         landmarker: Initialized MediaPipe HandLandmarker object.
     """
-    timestamp_ns0 = time.monotonic_ns() # Base for frame timestamps
+    show_preview = app_settings.SHOW_PREVIEW
+    if not show_preview:
+        # Headless: no OpenCV windows to take the quit key, so read it from stdin.
+        print("Preview disabled. Type 'q' and press Enter to quit.")
+        threading.Thread(target=_watch_stdin_for_quit, daemon=True).start()
+    frame_format = _select_frame_format(cam)
+    # Bound once; used every frame
+    monotonic = time.monotonic
+    MpImage = hand_tracker.MpImage
+    srgb_format = hand_tracker.MpImageFormat.SRGB
+    detect_async = landmarker.detect_async
+    timestamp_s0 = monotonic() # Base for frame timestamps
+    last_sent_ms = -1 # Timestamp of the last frame passed to detect_async
+    rgb_frame = None # Reused as the conversion target once allocated
+    annotation_shown = False # Whether the preview has shown an annotated frame
+    # Thumbnail and time of the last frame sent to detection, for motion gating
+    last_detected_small = None
+    last_detection_ms = 0
+    motion_skip_threshold = app_settings.MOTION_SKIP_THRESHOLD
+    max_skip_interval_ms = app_settings.MOTION_SKIP_MAX_INTERVAL_MS
 
     while True:
-        cam_status, bgr_frame = cam.read()
+        cam_status, frame = cam.read()
         if not cam_status:
             print("Error: Could not read frame from camera. scrcpy might have stopped.")
             break
+        if frame_format.raw_shape is not None:
+            frame = frame.reshape(frame_format.raw_shape) # Raw YUV, a view
         
-        current_time_ns = time.monotonic_ns()
-        frame_timestamp_ms = (current_time_ns - timestamp_ns0) // 1_000_000
-
-        # Display the original camera feed
-        cv2.imshow('Original Camera Feed', bgr_frame)
-
-        # Display the annotated frame from the callback if available
-        try:
-            annotated_frame = _annotated_frame_buffer.get_nowait()
-            cv2.imshow('Annotated Hand Landmarks', annotated_frame)
-        except queue.Empty:
-            pass # No new annotated frame, continue
-
-        # Process keyboard input
-        key = cv2.waitKey(1) & 0xFF
-        if key == ord('q'):
-            print("Quit key (q) pressed. Exiting loop.")
+        frame_timestamp_ms = int((monotonic() - timestamp_s0) * 1000.0)
+
+        if show_preview:
+            # Display the original camera feed (debugging aid, off by default)
+            if app_settings.SHOW_RAW_FEED:
+                if frame_format.to_bgr is None:
+                    cv2.imshow('Original Camera Feed', frame)
+                else:
+                    cv2.imshow('Original Camera Feed', cv2.cvtColor(frame, frame_format.to_bgr))
+
+            # Display the annotated frame from the callback if available. Until
+            # the first one arrives, show the camera frame in its place.
+            if _annotated_frame_buffer:
+                cv2.imshow('Annotated Hand Landmarks', _annotated_frame_buffer.popleft())
+                annotation_shown = True
+            elif not annotation_shown:
+                if frame_format.to_bgr is None:
+                    cv2.imshow('Annotated Hand Landmarks', frame)
+                else:
+                    cv2.imshow('Annotated Hand Landmarks', cv2.cvtColor(frame, frame_format.to_bgr))
+
+            # Process keyboard input and window events. pollKey() returns right
+            # away instead of sleeping for at least 1 ms like waitKey(1).
+            key = cv2.pollKey() & 0xFF
+            if key == ord('q'):
+                print("Quit key (q) pressed. Exiting loop.")
+                break
+        elif _quit_event.is_set():
+            print("Quit command (q) entered. Exiting loop.")
             break
         
-        # Convert frame from BGR (OpenCV) to RGB for MediaPipe
-        rgb_frame = cv2.cvtColor(bgr_frame, cv2.COLOR_BGR2RGB)
+        # detect_async requires strictly increasing timestamps; a frame read
+        # within the same millisecond as the last one sent is skipped.
+        if frame_timestamp_ms <= last_sent_ms:
+            continue
+
+        # Skip detection while the scene is static: the previous result (and
+        # cursor position) still applies, and a model pass is saved.
+        if motion_skip_threshold > 0:
+            # Thumbnails are compared in grayscale: raw YUV frames use their Y
+            # (luma) plane directly, BGR frames are converted after shrinking.
+            if frame_format.raw_shape is None:
+                small = cv2.resize(frame, _MOTION_THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA)
+                small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+            else:
+                small = cv2.resize(frame[:frame_format.luma_rows], _MOTION_THUMBNAIL_SIZE,
+                                   interpolation=cv2.INTER_AREA)
+            if (last_detected_small is not None
+                    and frame_timestamp_ms - last_detection_ms < max_skip_interval_ms
+                    and cv2.norm(small, last_detected_small, cv2.NORM_L1) / small.size
+                        < motion_skip_threshold):
+                continue
+            last_detected_small = small
+            last_detection_ms = frame_timestamp_ms
+
+        # Convert the frame (raw YUV or BGR) to RGB for MediaPipe. MpImage copies
+        # the pixels, so the same buffer can be reused for every frame.
+        rgb_frame = cv2.cvtColor(frame, frame_format.to_rgb, dst=rgb_frame)
         
         # Create MediaPipe Image object
-        mp_image = hand_tracker.MpImage(
-            image_format=hand_tracker.MpImageFormat.SRGB, data=rgb_frame
-        )
+        mp_image = MpImage(image_format=srgb_format, data=rgb_frame)
         
         # Perform asynchronous hand detection
-        landmarker.detect_async(mp_image, frame_timestamp_ms)
+        detect_async(mp_image, frame_timestamp_ms)
+        last_sent_ms = frame_timestamp_ms
 
 
 def run_application():
     """Main function to set up and run the hand gesture desktop control application."""
-    
-    if not _mouse_manager_instance.initialize():
+    scrcpy_cpu_affinity = app_settings.SCRCPY_CPU_AFFINITY
+    if app_settings.TRACKER_CPU_AFFINITY:
+        if scrcpy_cpu_affinity is None and hasattr(os, "sched_getaffinity"):
+            # scrcpy is spawned later and would inherit the tracker's mask;
+            # give it the original one instead.
+            scrcpy_cpu_affinity = os.sched_getaffinity(0)
+        # Done before MediaPipe starts its threads so they inherit the mask.
+        system_utils.set_cpu_affinity(0, app_settings.TRACKER_CPU_AFFINITY)
+
+    mouse_manager = mouse_control.MouseManager()
+    if not mouse_manager.initialize():
         # Initialization of mouse failed, but we might still want to run without mouse control
         # if app_settings.ENABLE_MOUSE_CONTROL was true.
         if app_settings.ENABLE_MOUSE_CONTROL: # Only print error if it was meant to be enabled
@@ -169,26 +391,35 @@ def run_application():
     scrcpy_process = None
 
     try:
-        cam, scrcpy_process = _initialize_camera_feed()
-        if not cam or not scrcpy_process:
-            print("Camera feed initialization failed. Exiting.")
-            return
-
-        # MediaPipe HandLandmarker setup
+        # MediaPipe HandLandmarker setup, done first so a missing model file
+        # is reported before scrcpy is started.
         # The 'with' statement ensures landmarker.close() is called.
+        result_callback = functools.partial(
+            _mediapipe_result_callback, mouse_manager=mouse_manager
+        )
         with hand_tracker.create_hand_landmarker(
-            app_settings.MODEL_ASSET_PATH, _mediapipe_result_callback
+            app_settings.MODEL_ASSET_PATH, result_callback,
+            delegate=app_settings.HAND_TRACKER_DELEGATE
         ) as landmarker:
             if landmarker is None: # create_hand_landmarker might raise but could also return None on some errors
                 print("Failed to create MediaPipe HandLandmarker. Exiting.")
                 # Ensure this case aligns with how create_hand_landmarker signals failure
                 return
-            print("MediaPipe HandLandmarker initialized.")
+            print(f"MediaPipe HandLandmarker initialized ({app_settings.HAND_MODEL_VARIANT} model).")
+
+            cam, scrcpy_process = _initialize_camera_feed(scrcpy_cpu_affinity)
+            if not cam or not scrcpy_process:
+                print("Camera feed initialization failed. Exiting.")
+                return
+
             main_loop(cam, landmarker)
 
-    except FileNotFoundError: # Specifically for model asset path in create_hand_landmarker
-        print(f"Error: Model asset file not found at '{app_settings.MODEL_ASSET_PATH}'. "
-              "Please ensure the path is correct and the file exists in app_settings.py.")
+    except FileNotFoundError as e:
+        if e.filename == app_settings.MODEL_ASSET_PATH: # Raised by create_hand_landmarker
+            print(f"CRITICAL ERROR: MediaPipe model file not found at '{app_settings.MODEL_ASSET_PATH}'.")
+            print(f"Please update MODEL_ASSET_PATHS['{app_settings.HAND_MODEL_VARIANT}'] in config/app_settings.py.")
+        else: # e.g. scrcpy is not installed; start_scrcpy_feed already reported it
+            print(f"Error: {e}")
     except KeyboardInterrupt:
         print("\nProcess interrupted by user (Ctrl+C).")
     except Exception as e:  # pylint: disable=broad-except
@@ -197,8 +428,8 @@ def run_application():
         traceback.print_exc() # Provides more detailed error info
     finally:
         print("Cleaning up resources...")
-        if _mouse_manager_instance: # _mouse_manager_instance is globally defined
-            _mouse_manager_instance.cleanup() # Call cleanup for mouse manager
+        _draw_executor.shutdown(wait=True)
+        mouse_manager.cleanup() # Release any mouse button held by a pinch
         if cam:
             cam.release()
             print("Camera released.")
@@ -210,8 +441,4 @@ def run_application():
 
 
 if __name__ == '__main__':
-    if not os.path.exists(app_settings.MODEL_ASSET_PATH):
-        print(f"CRITICAL ERROR: MediaPipe model file not found at '{app_settings.MODEL_ASSET_PATH}'.")
-        print("Please update MODEL_ASSET_PATH in config/app_settings.py.")
-    else:
-        run_application()
\ No newline at end of file
+    run_application()
\ No newline at end of file
@@ -1,5 +1,6 @@
 import os
-from typing import Tuple, Optional
+import subprocess
+from typing import Iterable, Tuple, Optional
 
 def get_screen_resolution() -> Tuple[Optional[int], Optional[int]]:
     """Gets the resolution of the primary screen using xdpyinfo (Linux specific).
@@ -10,9 +11,51 @@ def get_screen_resolution() -> Tuple[Optional[int], Optional[int]]:
         xdpyinfo is not available or fails.
     """
     try:
-        output = os.popen("xdpyinfo | grep dimensions | awk '{print $2}'").read()
-        screen_x_str, screen_y_str = output.strip().split('x')
-        return int(screen_x_str), int(screen_y_str)
-    except Exception as e:
+        output = subprocess.run(
+            ["xdpyinfo"], capture_output=True, text=True, check=True
+        ).stdout
+        for line in output.splitlines():
+            # e.g. "  dimensions:    1920x1080 pixels (508x285 millimeters)"
+            if "dimensions:" in line:
+                screen_x_str, screen_y_str = line.split()[1].split('x')
+                return int(screen_x_str), int(screen_y_str)
+        print("Could not get screen resolution using xdpyinfo: no dimensions in its output")
+    except FileNotFoundError:
+        print("Could not get screen resolution: xdpyinfo is not installed.")
+    except (subprocess.CalledProcessError, ValueError, IndexError) as e:
         print(f"Could not get screen resolution using xdpyinfo: {e}")
-        return None, None
+    return None, None
+
+
+def set_cpu_affinity(pid: int, cpus: Iterable[int]) -> bool:
+    """Restricts a process, including its existing threads, to a set of CPUs.
+
+    os.sched_setaffinity only affects the given thread, so it is applied to
+    every thread listed in /proc/<pid>/task. Threads created afterwards
+    inherit the mask. Linux specific; a no-op on other platforms.
+
+    Args:
+        pid: Process ID, or 0 for the calling process.
+        cpus: CPU indices the process may run on, e.g. {0, 1}.
+
+    Returns:
+        True if the affinity was applied, False if unsupported or it failed.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return False
+
+    cpus = set(cpus)
+    task_dir = f"/proc/{pid or os.getpid()}/task"
+    try:
+        if not os.path.isdir(task_dir):
+            os.sched_setaffinity(pid, cpus)
+            return True
+        for tid in os.listdir(task_dir):
+            try:
+                os.sched_setaffinity(int(tid), cpus)
+            except ProcessLookupError:
+                pass  # Thread exited while we were iterating
+        return True
+    except (OSError, ValueError) as e:
+        print(f"Could not set CPU affinity {sorted(cpus)} for pid {pid}: {e}")
+        return False
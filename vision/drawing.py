@@ -2,7 +2,6 @@ import cv2
 import mediapipe as mp
 import numpy as np
 from mediapipe import solutions
-from mediapipe.framework.formats import landmark_pb2
 
 # Type alias for MediaPipe's hand landmarker result
 HandLandmarkerResult = mp.tasks.vision.HandLandmarkerResult
@@ -11,63 +10,78 @@ HandLandmarkerResult = mp.tasks.vision.HandLandmarkerResult
 _MARGIN = 10  # Pixels
 _FONT_SIZE = 1.0  # OpenCV font scale
 _FONT_THICKNESS = 1 # OpenCV font thickness
-# Color for handedness text (Green in RGB, as drawing occurs on an RGB image)
-_HANDEDNESS_TEXT_COLOR_RGB = (88, 205, 54)
+# Color for handedness text (Green in BGR, as drawing occurs on a BGR image)
+_HANDEDNESS_TEXT_COLOR_BGR = (54, 205, 88)
+_LANDMARK_BORDER_COLOR_BGR = solutions.drawing_utils.WHITE_COLOR
 
+# MediaPipe's default hand drawing styles, resolved once into plain tuples so
+# drawing needs no per-frame style or proto objects.
+_default_connection_specs = solutions.drawing_styles.get_default_hand_connections_style()
+# (start index, end index, color, thickness) per connection, in the order
+# drawing_utils draws them so overlapping lines look the same.
+_CONNECTION_STYLES = tuple(
+    (start, end, _default_connection_specs[(start, end)].color,
+     _default_connection_specs[(start, end)].thickness)
+    for start, end in solutions.hands.HAND_CONNECTIONS
+)
+# (color, thickness, radius, border radius) indexed by landmark
+_LANDMARK_STYLES = tuple(
+    (spec.color, spec.thickness, spec.circle_radius,
+     max(spec.circle_radius + 1, int(spec.circle_radius * 1.2)))
+    for _, spec in sorted(solutions.drawing_styles.get_default_hand_landmarks_style().items())
+)
 
-def draw_landmarks_on_image(
-    rgb_image: np.ndarray,
+
+def draw_landmarks_on_image_inplace(
+    bgr_image: np.ndarray,
     detection_result: HandLandmarkerResult
-) -> np.ndarray:
-    """Draws hand landmarks and handedness on the input image.
+) -> None:
+    """Draws hand landmarks and handedness onto the input image in place.
 
-    This function modifies the input `rgb_image` by drawing landmarks and
-    text onto it. It's based on MediaPipe's official examples:
+    The image is BGR to match OpenCV display and MediaPipe's drawing styles.
+    It's based on MediaPipe's official examples:
     https://colab.research.google.com/github/googlesamples/mediapipe/blob/main/examples/hand_landmarker/python/hand_landmarker.ipynb
 
     Args:
-        rgb_image: The input image in RGB format as a NumPy array.
+        bgr_image: The input image in BGR format as a writable NumPy array.
                    This image will be modified.
         detection_result: The result object from MediaPipe HandLandmarker,
                           containing hand_landmarks and handedness.
-
-    Returns:
-        The input `rgb_image` NumPy array, now with landmarks and
-        handedness drawn on it.
     """
-    annotated_image = np.copy(rgb_image) # Work on a copy
-
     if not detection_result.hand_landmarks:
-        return annotated_image # Return copy if no landmarks
+        return
 
-    image_height, image_width, _ = annotated_image.shape
+    image_height, image_width, _ = bgr_image.shape
+    max_x = image_width - 1
+    max_y = image_height - 1
 
     for i, hand_landmarks in enumerate(detection_result.hand_landmarks):
-        # Draw the hand landmarks.
-        hand_landmarks_proto = landmark_pb2.NormalizedLandmarkList()
-        hand_landmarks_proto.landmark.extend([
-            landmark_pb2.NormalizedLandmark(
-                x=landmark.x, y=landmark.y, z=landmark.z
-            ) for landmark in hand_landmarks
-        ])
-        solutions.drawing_utils.draw_landmarks(
-            image=annotated_image,
-            landmark_list=hand_landmarks_proto,
-            connections=solutions.hands.HAND_CONNECTIONS,
-            landmark_drawing_spec=solutions.drawing_styles.get_default_hand_landmarks_style(),
-            connection_drawing_spec=solutions.drawing_styles.get_default_hand_connections_style()
-        )
+        # Pixel coordinates of each landmark; None if it lies outside the
+        # image, as in MediaPipe's drawing_utils.
+        points = [
+            (min(int(landmark.x * image_width), max_x), min(int(landmark.y * image_height), max_y))
+            if 0.0 <= landmark.x <= 1.0 and 0.0 <= landmark.y <= 1.0 else None
+            for landmark in hand_landmarks
+        ]
+
+        # Draw the connections, then the landmarks on top of them.
+        for start, end, color, thickness in _CONNECTION_STYLES:
+            start_point = points[start]
+            end_point = points[end]
+            if start_point is not None and end_point is not None:
+                cv2.line(bgr_image, start_point, end_point, color, thickness)
+        for point, (color, thickness, radius, border_radius) in zip(points, _LANDMARK_STYLES):
+            if point is not None:
+                cv2.circle(bgr_image, point, border_radius, _LANDMARK_BORDER_COLOR_BGR, thickness)
+                cv2.circle(bgr_image, point, radius, color, thickness)
 
         # Draw handedness (left or right hand) on the image.
         if detection_result.handedness and i < len(detection_result.handedness):
             handedness_entry = detection_result.handedness[i]
             
             # Calculate text position based on bounding box of landmarks
-            x_coords = [landmark.x * image_width for landmark in hand_landmarks]
-            y_coords = [landmark.y * image_height for landmark in hand_landmarks]
-            
-            text_x = int(min(x_coords))
-            text_y = int(min(y_coords)) - _MARGIN
+            text_x = int(min(landmark.x for landmark in hand_landmarks) * image_width)
+            text_y = int(min(landmark.y for landmark in hand_landmarks) * image_height) - _MARGIN
             
             # Adjust text position to be within image boundaries
             text_x = max(_MARGIN, text_x)
@@ -75,14 +89,12 @@ def draw_landmarks_on_image(
             text_y = max(_MARGIN * 2, text_y) 
 
             cv2.putText(
-                img=annotated_image,
+                img=bgr_image,
                 text=f"{handedness_entry[0].category_name}",
                 org=(text_x, text_y),
                 fontFace=cv2.FONT_HERSHEY_DUPLEX,
                 fontScale=_FONT_SIZE,
-                color=_HANDEDNESS_TEXT_COLOR_RGB,
+                color=_HANDEDNESS_TEXT_COLOR_BGR,
                 thickness=_FONT_THICKNESS,
                 lineType=cv2.LINE_AA
             )
-
-    return annotated_image
\ No newline at end of file
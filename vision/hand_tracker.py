@@ -1,19 +1,51 @@
-from typing import Callable
+from typing import Any, Callable, List
 
 import mediapipe as mp
+import numpy as np
 
 # Type aliases for MediaPipe components, re-exported for convenience.
 HandLandmarkerResult = mp.tasks.vision.HandLandmarkerResult
 MpImage = mp.Image
 MpImageFormat = mp.ImageFormat
 
+# MediaPipe Tasks classes used to build the landmarker.
+_BaseOptions = mp.tasks.BaseOptions
+_HandLandmarker = mp.tasks.vision.HandLandmarker
+_HandLandmarkerOptions = mp.tasks.vision.HandLandmarkerOptions
+_VisionRunningMode = mp.tasks.vision.RunningMode
+
 # Define a more specific callable type for the result callback function
 ResultCallbackType = Callable[[HandLandmarkerResult, MpImage, int], None]
 
+# Number of landmarks MediaPipe reports per detected hand.
+NUM_HAND_LANDMARKS = 21
+
+
+def landmarks_to_array(hand_landmarks: List[Any]) -> np.ndarray:
+    """Copies the landmarks of one hand into a contiguous NumPy array.
+
+    Reading .x/.y/.z off each landmark object is done once here, so consumers
+    can index plain floats instead of going back to the landmark objects.
+
+    Args:
+        hand_landmarks: List of NormalizedLandmark objects for one hand,
+            i.e. an element of HandLandmarkerResult.hand_landmarks.
+
+    Returns:
+        A float32 array of shape (len(hand_landmarks), 3) holding x, y, z.
+    """
+    return np.fromiter(
+        (value for landmark in hand_landmarks
+         for value in (landmark.x, landmark.y, landmark.z)),
+        dtype=np.float32,
+        count=3 * len(hand_landmarks)
+    ).reshape(-1, 3)
+
 
 def create_hand_landmarker(
     model_path: str,
-    result_callback_fn: ResultCallbackType
+    result_callback_fn: ResultCallbackType,
+    delegate: str = 'cpu'
 ) -> mp.tasks.vision.HandLandmarker:
     """Creates and configures a MediaPipe HandLandmarker for live stream mode.
 
@@ -24,27 +56,40 @@ def create_hand_landmarker(
             - result: mediapipe.tasks.vision.HandLandmarkerResult
             - output_image: mediapipe.Image (the input image passed to detect_async)
             - timestamp_ms: int (the timestamp passed to detect_async)
+        delegate: Inference backend, 'cpu' or 'gpu'. If the GPU delegate
+            cannot be created or is not supported on this platform, falls
+            back to the CPU.
+            Defaults to 'cpu'.
 
     Returns:
         A mediapipe.tasks.vision.HandLandmarker instance.
     
     Raises:
+        FileNotFoundError: If the model file does not exist.
         RuntimeError: If the hand landmarker cannot be created from options
-                      (e.g., model file not found, invalid options). This is
+                      (e.g., an invalid model file or options). This is
                       typically raised by MediaPipe's `create_from_options`.
     """
-    BaseOptions = mp.tasks.BaseOptions
-    HandLandmarker = mp.tasks.vision.HandLandmarker
-    HandLandmarkerOptions = mp.tasks.vision.HandLandmarkerOptions
-    VisionRunningMode = mp.tasks.vision.RunningMode
-
-    options = HandLandmarkerOptions(
-        base_options=BaseOptions(model_asset_path=model_path),
-        running_mode=VisionRunningMode.LIVE_STREAM,
-        num_hands=1,  # Assuming control with one hand for simplicity
-        min_hand_detection_confidence=0.5,
-        min_hand_presence_confidence=0.5,
-        min_tracking_confidence=0.5,
-        result_callback=result_callback_fn
-    )
-    return HandLandmarker.create_from_options(options)
\ No newline at end of file
+    # Read the model once: a GPU attempt and the CPU fallback both use the
+    # same bytes, and a missing file surfaces as FileNotFoundError rather than
+    # a generic RuntimeError from MediaPipe.
+    with open(model_path, 'rb') as model_file:
+        model_buffer = model_file.read()
+
+    def make_options(delegate_enum):
+        return _HandLandmarkerOptions(
+            base_options=_BaseOptions(model_asset_buffer=model_buffer, delegate=delegate_enum),
+            running_mode=_VisionRunningMode.LIVE_STREAM,
+            num_hands=1,  # Assuming control with one hand for simplicity
+            min_hand_detection_confidence=0.5,
+            min_hand_presence_confidence=0.5,
+            min_tracking_confidence=0.5,
+            result_callback=result_callback_fn
+        )
+
+    if delegate.lower() == 'gpu':
+        try:
+            return _HandLandmarker.create_from_options(make_options(_BaseOptions.Delegate.GPU))
+        except (RuntimeError, NotImplementedError) as e:
+            print(f"Warning: Could not create HandLandmarker with the GPU delegate ({e}). Retrying on CPU.")
+    return _HandLandmarker.create_from_options(make_options(_BaseOptions.Delegate.CPU))
\ No newline at end of file